@@ -6,27 +6,128 @@ __license__ = "MIT"
 __copyright__ = "Copyright 2025-present raeist"
 __version__ = "0.0.1"
 
-from typing import Type
-
-from .core.abc import *
-from .core.common import *
-from .core.dataio import *
-
-from .client.client import *
-from .client.node import *
-from .client.nodemanager import *
-from .client.filters import *
-
-from .player.player import *
-from .player.playermanager import *
-from .player.events import *
-
-from .errors.errors import *
-
-from .utils.helpers import *
-
-
-def listener(*events: Type[Event]):
+import importlib
+from typing import TYPE_CHECKING, Type
+
+if TYPE_CHECKING:
+    from .core.abc import *
+    from .core.common import *
+    from .core.dataio import *
+
+    from .client.client import *
+    from .client.node import *
+    from .client.nodemanager import *
+    from .client.filters import *
+
+    from .player.player import *
+    from .player.playermanager import *
+    from .player.events import *
+
+    from .errors.errors import *
+
+    from .utils.helpers import *
+
+# Public names re-exported from each submodule, in the order the submodules used to be
+# star-imported. A submodule is only imported when one of its names is first accessed.
+# Keep this in sync with the submodules' ``__all__``.
+_EXPORTS = {
+    ".core.abc": ("BasePlayer", "DeferredAudioTrack", "Source", "Filter"),
+    ".core.common": ("MISSING",),
+    ".core.dataio": ("DataReader", "DataWriter"),
+    ".client.client": ("Client",),
+    ".client.node": ("Node",),
+    ".client.nodemanager": ("NodeManager",),
+    ".client.filters": (
+        "Volume",
+        "Equalizer",
+        "Karaoke",
+        "Timescale",
+        "Tremolo",
+        "Vibrato",
+        "Rotation",
+        "LowPass",
+        "ChannelMix",
+        "Distortion",
+    ),
+    ".player.player": ("DefaultPlayer",),
+    ".player.playermanager": ("PlayerManager",),
+    ".player.events": (
+        "Event",
+        "TrackStartEvent",
+        "TrackStuckEvent",
+        "TrackExceptionEvent",
+        "TrackEndEvent",
+        "TrackLoadFailedEvent",
+        "QueueEndEvent",
+        "PlayerUpdateEvent",
+        "PlayerErrorEvent",
+        "NodeConnectedEvent",
+        "NodeChangedEvent",
+        "NodeDisconnectedEvent",
+        "NodeReadyEvent",
+        "WebSocketClosedEvent",
+        "IncomingWebSocketMessage",
+    ),
+    ".errors.errors": (
+        "ClientError",
+        "AuthenticationError",
+        "InvalidTrack",
+        "LoadError",
+        "RequestError",
+    ),
+    ".utils.helpers": (
+        "timestamp_to_millis",
+        "format_time",
+        "parse_time",
+        "decode_track",
+        "encode_track",
+    ),
+}
+
+# Maps each re-exported name to its submodule. Later submodules win on duplicate names,
+# matching the previous star-import behaviour.
+_LAZY = {name: submodule for submodule, names in _EXPORTS.items() for name in names}
+
+# Subpackages that were bound onto the package by the star imports. Accessing one imports
+# its re-exported submodules, so paths such as ``pega.player.events`` keep working after a
+# plain ``import pega``.
+_SUBPACKAGES = ("core", "client", "player", "errors", "utils")
+
+
+def _load_all():
+    modules = {submodule: importlib.import_module(submodule, __name__) for submodule in _EXPORTS}
+    exported = {name: getattr(modules[submodule], name) for name, submodule in _LAZY.items()}
+    exported["__all__"] = ("listener", *_LAZY)
+    globals().update(exported)
+    return exported["__all__"]
+
+
+def __getattr__(name: str):
+    if name == "__all__":
+        return _load_all()
+
+    if name in _SUBPACKAGES:
+        for submodule in _EXPORTS:
+            if submodule.startswith(f".{name}."):
+                importlib.import_module(submodule, __name__)
+
+        return importlib.import_module(f".{name}", __name__)
+
+    try:
+        submodule = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+
+    value = getattr(importlib.import_module(submodule, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted({*globals(), *_SUBPACKAGES, *_LAZY})
+
+
+def listener(*events: Type["Event"]):
     """
     Marks this function as an event listener for Pegasus.
     This **must** be used on class methods, and you must ensure that you register
@@ -23,7 +23,8 @@ SOFTWARE.
 """
 
 import logging
-from abc import ABC, abstractmethod
+import sys
+import warnings
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -34,7 +35,6 @@ from typing import (
     Sequence,
     TypeVar,
     Union,
-    cast,
 )
 
 from pega.core.common import MISSING, VoiceServerUpdateData, VoiceStateUpdateData
@@ -56,6 +56,10 @@ __all__ = (
 
 _log = logging.getLogger(__name__)
 
+_VOICE_SERVER_SET: Final[int] = 0b011
+_VOICE_SESSION_SET: Final[int] = 0b100
+_VOICE_STATE_READY: Final[int] = _VOICE_SERVER_SET | _VOICE_SESSION_SET
+
 FilterValueT = TypeVar(
     "FilterValueT",
     Dict[str, Any],
@@ -65,7 +69,7 @@ FilterValueT = TypeVar(
 )
 
 
-class BasePlayer(ABC):
+class BasePlayer:
     """
     Represents the BasePlayer all players must be inherited from.
 
@@ -93,7 +97,10 @@ class BasePlayer(ABC):
         "_next",
         "_internal_id",
         "_original_node",
-        "_voice_state",
+        "_vs_session_id",
+        "_vs_endpoint",
+        "_vs_token",
+        "_voice_state_flags",
     )
 
     def __init__(self, guild_id: int, node: "Node"):
@@ -104,11 +111,35 @@ class BasePlayer(ABC):
         self.current: Optional[AudioTrack] = None
 
         self._next: Optional[AudioTrack] = None
-        self._internal_id: Final[str] = str(guild_id)
+        self._internal_id: Final[str] = sys.intern(str(guild_id))
         self._original_node: Optional["Node"] = None
-        self._voice_state = {}
+        self._vs_session_id: Optional[str] = None
+        self._vs_endpoint: Optional[str] = None
+        self._vs_token: Optional[str] = None
+        self._voice_state_flags: int = 0
+
+    @property
+    def _voice_state(self) -> Dict[str, str]:
+        """
+        A read-only snapshot of the voice state, in the form sent to the node.
+
+        .. deprecated::
+            The voice state is now stored in the ``_vs_session_id``, ``_vs_endpoint`` and
+            ``_vs_token`` slots. Changes to the returned dict are not reflected on the player;
+            use :meth:`_dispatch_voice_update` to resend the voice state to the node.
+        """
+        warnings.warn(
+            "BasePlayer._voice_state is deprecated and returns a read-only snapshot",
+            DeprecationWarning,
+            stacklevel=2,
+        )
+        voice_state = {
+            "sessionId": self._vs_session_id,
+            "endpoint": self._vs_endpoint,
+            "token": self._vs_token,
+        }
+        return {key: value for key, value in voice_state.items() if value is not None}
 
-    @abstractmethod
     async def handle_event(self, event: Event):
         """|coro|
 
@@ -121,7 +152,6 @@ class BasePlayer(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     async def update_state(self, state: RawPlayerState):
         """|coro|
 
@@ -179,7 +209,7 @@ class BasePlayer(ABC):
         Optional[:class:`RawPlayer`]
             The updated `player object`_, or ``None`` if no request was made.
         """
-        if track is MISSING or not isinstance(track, AudioTrack):
+        if not isinstance(track, AudioTrack):
             raise ValueError("track must be an instance of an AudioTrack!")
 
         options = kwargs
@@ -206,7 +236,7 @@ class BasePlayer(ABC):
         if volume is not MISSING:
             if not isinstance(volume, int):
                 raise TypeError("volume must be an int")
-            options["volume"] = max(min(volume, 1000), 0)
+            options["volume"] = 1000 if volume > 1000 else 0 if volume < 0 else volume
 
         if pause is not MISSING:
             if not isinstance(pause, bool):
@@ -237,13 +267,18 @@ class BasePlayer(ABC):
 
         self._next = track
 
-        if "user_data" not in options and track.user_data:
-            options["user_data"] = track.user_data
+        if not options and not track.user_data:
+            response = await self.node.update_player(
+                guild_id=self._internal_id, encoded_track=playable_track
+            )
+        else:
+            if "user_data" not in options and track.user_data:
+                options["user_data"] = track.user_data
 
-        response = await self.node.update_player(
-            guild_id=self._internal_id, encoded_track=playable_track, **options
-        )
-        return cast(RawPlayer, response)
+            response = await self.node.update_player(
+                guild_id=self._internal_id, encoded_track=playable_track, **options
+            )
+        return response  # type: ignore[return-value]
 
     def cleanup(self):
         pass
@@ -256,35 +291,51 @@ class BasePlayer(ABC):
         await self.client.player_manager.destroy(self.guild_id)
 
     async def _voice_server_update(self, data: VoiceServerUpdateData):
-        self._voice_state.update(endpoint=data["endpoint"], token=data["token"])
+        self._vs_endpoint = data["endpoint"]
+        self._vs_token = data["token"]
+        self._voice_state_flags |= _VOICE_SERVER_SET
 
-        if "sessionId" not in self._voice_state:
+        if not self._voice_state_flags & _VOICE_SESSION_SET:
             _log.warning(
                 "[Player:%s] Missing sessionId, is the client User ID correct?",
                 self.guild_id,
             )
-
-        await self._dispatch_voice_update()
+        else:
+            await self._dispatch_voice_update()
 
     async def _voice_state_update(self, data: VoiceStateUpdateData):
         raw_channel_id = data["channel_id"]
-        self.channel_id = int(raw_channel_id) if raw_channel_id else None
 
-        if not self.channel_id:
-            self._voice_state.clear()
+        if not raw_channel_id:
+            self.channel_id = None
+
+            if self._voice_state_flags:
+                self._vs_session_id = None
+                self._vs_endpoint = None
+                self._vs_token = None
+                self._voice_state_flags = 0
             return
 
-        if data["session_id"] != self._voice_state.get("sessionId"):
-            self._voice_state.update(sessionId=data["session_id"])
-            await self._dispatch_voice_update()
+        self.channel_id = int(raw_channel_id)
+
+        if data["session_id"] != self._vs_session_id:
+            self._vs_session_id = data["session_id"]
+            self._voice_state_flags |= _VOICE_SESSION_SET
+
+            if self._voice_state_flags == _VOICE_STATE_READY:
+                await self._dispatch_voice_update()
 
     async def _dispatch_voice_update(self):
-        if {"sessionId", "endpoint", "token"} == self._voice_state.keys():
+        if self._voice_state_flags == _VOICE_STATE_READY:
             await self.node.update_player(
-                guild_id=self._internal_id, voice_state=self._voice_state  # type: ignore
+                guild_id=self._internal_id,
+                voice_state={  # type: ignore
+                    "sessionId": self._vs_session_id,
+                    "endpoint": self._vs_endpoint,
+                    "token": self._vs_token,
+                },
             )
 
-    @abstractmethod
     async def node_unavailable(self):
         """|coro|
 
@@ -292,7 +343,6 @@ class BasePlayer(ABC):
         """
         raise NotImplementedError
 
-    @abstractmethod
     async def change_node(self, node: "Node"):
         """|coro|
 
@@ -301,7 +351,7 @@ class BasePlayer(ABC):
         raise NotImplementedError
 
 
-class DeferredAudioTrack(ABC, AudioTrack):
+class DeferredAudioTrack(AudioTrack):
     """
     Similar to an :class:`AudioTrack`, however this track only stores metadata up until it's
     played, at which time :func:`load` is called.
@@ -309,7 +359,6 @@ class DeferredAudioTrack(ABC, AudioTrack):
 
     __slots__ = ()
 
-    @abstractmethod
     async def load(self, client: "Client") -> Optional[str]:
         """|coro|
 
@@ -318,21 +367,23 @@ class DeferredAudioTrack(ABC, AudioTrack):
         raise NotImplementedError
 
 
-class Source(ABC):
-    __slots__ = ("name",)
+class Source:
+    __slots__ = ("name", "_hash")
 
     def __init__(self, name: str):
-        self.name: str = name
+        self.name: Final[str] = sys.intern(str.__str__(name))
+        self._hash: Final[int] = hash(self.name)
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if self.__class__ is other.__class__:
             return self.name == other.name
         return False
 
     def __hash__(self):
-        return hash(self.name)
+        return self._hash
 
-    @abstractmethod
     async def load_item(self, client: "Client", query: str) -> Optional["LoadResult"]:
         """|coro|
 
@@ -344,7 +395,7 @@ class Source(ABC):
         return f"<Source name={self.name}>"
 
 
-class Filter(ABC, Generic[FilterValueT]):
+class Filter(Generic[FilterValueT]):
     """
     A class representing a Pegasus audio filter.
     """
@@ -355,10 +406,8 @@ class Filter(ABC, Generic[FilterValueT]):
         self.values: FilterValueT = values
         self.plugin_filter: Final[bool] = plugin_filter
 
-    @abstractmethod
     def update(self, **kwargs):
         raise NotImplementedError
 
-    @abstractmethod
     def serialize(self) -> Dict[str, FilterValueT]:
         raise NotImplementedError
@@ -0,0 +1,39 @@
+import enum
+
+import pytest
+
+from pega.core.abc import Source
+
+
+class _StrSource(str, enum.Enum):
+    YOUTUBE = "youtube"
+
+
+def test_source_plain_str():
+    source = Source("youtube")
+
+    assert source.name == "youtube"
+    assert type(source.name) is str
+    assert source == Source("youtube")
+    assert hash(source) == hash(Source("youtube"))
+
+
+def test_source_str_mixin_enum():
+    source = Source(_StrSource.YOUTUBE)
+
+    assert source.name == "youtube"
+    assert type(source.name) is str
+    assert source == Source("youtube")
+    assert hash(source) == hash(Source("youtube"))
+
+
+@pytest.mark.skipif(not hasattr(enum, "StrEnum"), reason="enum.StrEnum requires Python 3.11+")
+def test_source_strenum():
+    class _Sources(enum.StrEnum):
+        YOUTUBE = "youtube"
+
+    source = Source(_Sources.YOUTUBE)
+
+    assert source.name == "youtube"
+    assert type(source.name) is str
+    assert source == Source("youtube")
@@ -0,0 +1,22 @@
+import importlib
+
+import pytest
+
+import pega
+
+
+@pytest.mark.parametrize("submodule", list(pega._EXPORTS))
+def test_exports_match_submodule_all(submodule):
+    module = importlib.import_module(submodule, pega.__name__)
+
+    assert pega._EXPORTS[submodule] == tuple(module.__all__)
+
+
+def test_subpackage_attribute_access():
+    from pega.player.events import TrackStartEvent
+
+    assert pega.player.events.TrackStartEvent is TrackStartEvent
+
+
+def test_unknown_attribute():
+    assert not hasattr(pega, "does_not_exist")